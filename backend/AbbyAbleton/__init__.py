@@ -267,6 +267,9 @@ class AbletonListener(ControlSurface):
             "add_notes_to_arrangement_clip": lambda p: self._add_notes_to_arrangement_clip(
                 p["track_index"], p["clip_index"], p["notes"]
             ),
+            "fill_arrangement_section": lambda p: self._fill_arrangement_section(
+                p["track_index"], p["source_slot"], p["start_beat"], p["end_beat"]
+            ),
         }
 
     # --- Command implementations (unchanged from original) ---
@@ -746,6 +749,38 @@ class AbletonListener(ControlSurface):
         clip.add_new_notes(specs)
         return {"note_count": len(notes)}
 
+    def _fill_arrangement_section(self, track_index, source_slot, start_beat, end_beat):
+        """Tile a session clip across [start_beat, end_beat) in the arrangement."""
+        try:
+            if track_index < 0 or track_index >= len(self._song.tracks):
+                raise IndexError("Track index out of range")
+
+            track = self._song.tracks[track_index]
+
+            if source_slot < 0 or source_slot >= len(track.clip_slots):
+                raise IndexError("Clip index out of range")
+
+            clip_slot = track.clip_slots[source_slot]
+            if not clip_slot.has_clip:
+                raise Exception("No clip in slot")
+
+            clip = clip_slot.clip
+            if clip.length <= 0:
+                raise ValueError("Source clip has no length")
+
+            count = 0
+            pos = float(start_beat)
+            while pos < end_beat:
+                track.duplicate_clip_to_arrangement(clip, pos)
+                pos += clip.length
+                count += 1
+            return {"clip_count": count, "clip_length": clip.length}
+        except Exception as e:
+            self.log_message(
+                f"Error filling arrangement on track {track_index} from slot {source_slot}: {e}"
+            )
+            raise
+
     def _set_clip_name(self, track_index, clip_index, name):
         """Set the name of a clip"""
         try:
@@ -1,8 +1,10 @@
 """Async TCP client for Our Remote MIDI Script (replaces the OSC-based AbletonClient in ableton.py)."""
 
 import asyncio
+import itertools
 import json as _json
-import uuid
+import random
+import time
 from collections.abc import Coroutine
 from functools import lru_cache
 from typing import Any, Callable
@@ -29,6 +31,26 @@ from .models import (
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 9877
+# Track/device names rarely change mid-session, and any write made through the
+# client invalidates the cache immediately.
+NAME_CACHE_TTL = 60.0
+# Parameter values can also change from Live's UI, so only reuse them briefly.
+PARAM_CACHE_TTL = 1.0
+# Song-level state the agent re-reads at the start of most turns.
+SONG_CACHE_TTL = 2.0
+# Per-track reads the agent repeats while working through a request.
+TRACK_CACHE_TTL = 5.0
+CONNECT_ATTEMPTS = 3
+PROBE_TIMEOUT = 0.5
+WRITE_HIGH_WATER = 64 * 1024
+READ_LIMIT = 10 * 1024 * 1024  # largest response line accepted, 10 MB
+EVENT_QUEUE_SIZE = 1024
+MAX_PENDING_COMMANDS = 128
+MAX_BACKOFF = 30.0
+
+
+def _dumps(obj: Any) -> bytes:
+    return _json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -54,51 +76,96 @@ class _AbletonConnection:
         self._port = port
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
-        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._next_id = itertools.count(1)
+        # Caps commands awaiting a reply so a stalled script can't pile up
+        # an unbounded number of pending futures.
+        self._send_slots = asyncio.Semaphore(MAX_PENDING_COMMANDS)
         self._event_handler: (
             Callable[[dict[str, Any]], Coroutine[Any, Any, None]] | None
         ) = None
-        self._connect_lock = asyncio.Lock()
+        # The connect cycle in progress, if any. Concurrent callers all await
+        # this one task, so they share its attempts and its failure.
+        self._connecting: asyncio.Task[None] | None = None
         self._read_task: asyncio.Task[None] | None = None
+        # Push events are handed to one long-lived worker, in arrival order,
+        # rather than spawning a task per event.
+        self._events: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=EVENT_QUEUE_SIZE
+        )
+        self._event_task: asyncio.Task[None] | None = None
+
+    async def connect(self, max_attempts: int = CONNECT_ATTEMPTS) -> None:
+        """Open the connection, retrying refused/timed-out attempts with backoff.
 
-    async def connect(self) -> None:
-        async with self._connect_lock:
-            if self._writer is not None and not self._writer.is_closing():
-                return
+        Callers that arrive while a connect cycle is already running wait for
+        that cycle and get its result, rather than each starting their own.
+        Anything other than an ``OSError`` is a programming error and is
+        re-raised immediately.
+        """
+        if self._writer is not None and not self._writer.is_closing():
+            return
+        task = self._connecting
+        if task is None:
+            task = asyncio.create_task(self._open(max_attempts))
+            self._connecting = task
+            task.add_done_callback(self._connect_done)
+        # Shielded so one waiter being cancelled doesn't cancel the others.
+        await asyncio.shield(task)
+
+    def _connect_done(self, task: asyncio.Task[None]) -> None:
+        self._connecting = None
+        # Retrieve the failure here too, so a cycle whose waiters were all
+        # cancelled isn't reported as "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+    async def _open(self, max_attempts: int) -> None:
+        for attempt in range(max_attempts):
             logger.info(
                 f"[ABLETON] Connecting to Our Remote MIDI Script at {self._host}:{self._port}"
             )
-            self._reader, self._writer = await asyncio.open_connection(
-                self._host,
-                self._port,
-                limit=10 * 1024 * 1024,  # 10 MB
-            )
-            self._read_task = asyncio.create_task(self._read_loop())
-            logger.info("[ABLETON] Connected to Our Remote MIDI Script")
+            try:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self._host,
+                    self._port,
+                    limit=READ_LIMIT,
+                )
+                break
+            except OSError as exc:
+                if attempt == max_attempts - 1:
+                    raise
+                # Jitter keeps separate backend processes from reconnecting in
+                # lock-step when Live restarts.
+                wait = min(MAX_BACKOFF, 0.5 * 2**attempt) * random.uniform(1, 1.5)
+                logger.warning(
+                    f"[ABLETON] Connection failed ({exc}), retrying in {wait:.2f}s"
+                )
+                await asyncio.sleep(wait)
+        self._read_task = asyncio.create_task(self._read_loop())
+        if self._event_task is None or self._event_task.done():
+            self._event_task = asyncio.create_task(self._dispatch_events())
+        logger.info("[ABLETON] Connected to Our Remote MIDI Script")
 
     async def _read_loop(self) -> None:
         """Background task: read newline-delimited JSON and dispatch."""
         assert self._reader is not None
+        # Framed by hand so one read can deliver several lines, rather than
+        # one readline() call and copy per message.
+        buf = bytearray()
         try:
             while True:
-                line = await self._reader.readline()
-                if not line:
+                chunk = await self._reader.read(65536)
+                if not chunk:
                     break
-                try:
-                    message: dict[str, Any] = _json.loads(line.decode("utf-8"))
-                except ValueError:
-                    logger.warning("[ABLETON] Received malformed JSON line, skipping")
-                    continue
-
-                if "id" in message:
-                    # Command response — route to the waiting future.
-                    future = self._pending.pop(message["id"], None)
-                    if future is not None and not future.done():
-                        future.set_result(message)
-                else:
-                    # Push event (no id) — forward to registered handler.
-                    if self._event_handler is not None:
-                        asyncio.create_task(self._event_handler(message))
+                buf += chunk
+                start = 0
+                while (end := buf.find(b"\n", start)) >= 0:
+                    self._dispatch(buf[start:end])
+                    start = end + 1
+                del buf[:start]
+                if len(buf) > READ_LIMIT:
+                    raise ValueError("response line exceeds READ_LIMIT")
         except Exception as exc:
             logger.error(f"[ABLETON] Read loop error: {exc}")
         finally:
@@ -113,22 +180,70 @@ class _AbletonConnection:
             self._reader = None
             logger.info("[ABLETON] Disconnected from Our Remote MIDI Script")
 
-    async def send(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Send a command and await its response. Auto-reconnects if needed."""
-        if self._writer is None or self._writer.is_closing():
-            await self.connect()
-        assert self._writer is not None
-
-        request_id = str(uuid.uuid4())
-        payload = {**payload, "id": request_id}
+    def _dispatch(self, line: bytes | bytearray) -> None:
+        try:
+            message: dict[str, Any] = _json.loads(line)
+        except ValueError:
+            logger.warning("[ABLETON] Received malformed JSON line, skipping")
+            return
+
+        if "id" in message:
+            # Command response — route to the waiting future.
+            future = self._pending.pop(message["id"], None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        else:
+            # Push event (no id) — forward to registered handler.
+            if self._event_handler is not None:
+                try:
+                    self._events.put_nowait(message)
+                except asyncio.QueueFull:
+                    # A slow handler must not stall command responses.
+                    logger.warning("[ABLETON] Event queue full, dropping push event")
+
+    async def _dispatch_events(self) -> None:
+        """Background task: deliver queued push events to the handler in order."""
+        while True:
+            message = await self._events.get()
+            handler = self._event_handler
+            if handler is None:
+                continue
+            try:
+                await handler(message)
+            # The handler is arbitrary listener code. If one event's error
+            # escaped, this worker would die and every later event would be
+            # silently dropped, so log it with its traceback and keep going.
+            except Exception:  # noqa: BLE001
+                logger.exception("[ABLETON] Event handler error")
 
-        loop = asyncio.get_running_loop()
-        future: asyncio.Future[dict[str, Any]] = loop.create_future()
-        self._pending[request_id] = future
+    async def send(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send a command and await its response. Auto-reconnects if needed.
 
-        self._writer.write((_json.dumps(payload) + "\n").encode("utf-8"))
-        await self._writer.drain()
-        return await future
+        The request id is added to *payload* in place, so callers pass a dict
+        built for this call.
+        """
+        async with self._send_slots:
+            if self._writer is None or self._writer.is_closing():
+                await self.connect()
+            assert self._writer is not None
+
+            request_id = next(self._next_id)
+            payload["id"] = request_id
+
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[dict[str, Any]] = loop.create_future()
+            self._pending[request_id] = future
+            try:
+                self._writer.writelines((_dumps(payload), b"\n"))
+                # Commands are tiny, so the buffer is normally flushed straight
+                # to the socket. Only wait for it to drain if the script has
+                # stopped reading.
+                if self._writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    await self._writer.drain()
+                return await future
+            finally:
+                # A cancelled caller must not leave its future behind.
+                self._pending.pop(request_id, None)
 
     def set_event_handler(
         self, handler: Callable[[dict[str, Any]], Coroutine[Any, Any, None]] | None
@@ -148,11 +263,33 @@ async def _cmd(
 ) -> Any:
     """Send a command and return ``result``, raising ``RuntimeError`` on error."""
     resp = await conn.send({"type": cmd_type, "params": params or {}})
+    result = resp.get("result")
+    if result is not None:
+        return result
+    # Only replies without a result can be errors.
     if resp.get("status") == "error":
         raise RuntimeError(
             f"Our Remote MIDI Script error ({cmd_type}): {resp.get('message')}"
         )
-    return resp.get("result", {})
+    return {}
+
+
+def _cache_key(cmd_type: str, params: dict[str, Any]) -> tuple[Any, ...]:
+    """Key for a read in the client cache, independent of params order."""
+    return (cmd_type, tuple(sorted(params.items())))
+
+
+@lru_cache(maxsize=16)
+def _song_context(
+    tempo: float, numerator: int, denominator: int, num_tracks: int
+) -> SongContext:
+    """Build a SongContext, reusing the instance while the song is unchanged."""
+    return SongContext(
+        tempo=tempo,
+        time_sig_numerator=numerator,
+        time_sig_denominator=denominator,
+        num_tracks=num_tracks,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -163,16 +300,70 @@ async def _cmd(
 class AbletonClient:
     def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
         self._conn = _AbletonConnection(host, port)
+        # (cmd_type, params) -> (fetched_at, result), cleared by every write.
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._cache_generation = 0
+        # Identical reads issued concurrently share one round trip.
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+    async def _read(
+        self, cmd_type: str, params: dict[str, Any] | None = None, ttl: float = 0.0
+    ) -> Any:
+        """Run a read command, serving it from cache if fetched less than *ttl* ago.
+
+        Callers that issue the same read while one is already in flight await
+        that request instead of sending a duplicate.
+        """
+        params = params or {}
+        key = _cache_key(cmd_type, params)
+        if ttl > 0:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+        task = self._inflight.get(key)
+        if task is not None:
+            # Shielded so one waiter being cancelled doesn't cancel the others.
+            return await asyncio.shield(task)
+        task = asyncio.create_task(_cmd(self._conn, cmd_type, params))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._read_done(key, t))
+        generation = self._cache_generation
+        r = await asyncio.shield(task)
+        # A write that completed while this read was in flight may have made
+        # the result stale, so only cache it if no write has happened since.
+        if ttl > 0 and generation == self._cache_generation:
+            self._cache[key] = (time.monotonic(), r)
+        return r
+
+    def _read_done(self, key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have been cancelled; retrieve the failure here so it
+        # isn't reported as "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+    async def _write(self, cmd_type: str, params: dict[str, Any] | None = None) -> Any:
+        """Run a state-changing command and invalidate all cached reads."""
+        try:
+            return await _cmd(self._conn, cmd_type, params)
+        finally:
+            self._invalidate_cache()
 
-    async def start(self) -> None:
-        """No-op: connection is lazy.  Kept for interface compatibility."""
-        pass
+    def _invalidate_cache(self) -> None:
+        self._cache_generation += 1
+        self._cache.clear()
+        # Reads issued after a write must not join a request sent before it.
+        self._inflight.clear()
 
     # --- Connectivity ---
 
     async def is_live(self) -> bool:
         try:
-            await _cmd(self._conn, "get_session_info")
+            # A health probe should fail fast instead of sitting through the
+            # connect retries and backoff that commands get.
+            await asyncio.wait_for(self._conn.connect(max_attempts=1), PROBE_TIMEOUT)
+            await asyncio.wait_for(self._read("get_session_info"), PROBE_TIMEOUT)
             logger.info("[ABLETON] Successfully connected to Ableton Live")
             return True
         except Exception:
@@ -183,16 +374,16 @@ class AbletonClient:
 
     async def get_song_context(self) -> SongContext:
         logger.info("[ABLETON] get_song_context()")
-        r = await _cmd(self._conn, "get_session_info")
-        return SongContext(
-            tempo=float(r["tempo"]),
-            time_sig_numerator=int(r["signature_numerator"]),
-            time_sig_denominator=int(r["signature_denominator"]),
-            num_tracks=int(r["track_count"]),
+        r = await self._read("get_session_info", ttl=SONG_CACHE_TTL)
+        return _song_context(
+            r["tempo"],
+            r["signature_numerator"],
+            r["signature_denominator"],
+            r["track_count"],
         )
 
     async def get_project_structure(self) -> ProjectStructure:
-        r = await _cmd(self._conn, "get_project_structure")
+        r = await self._read("get_project_structure", ttl=SONG_CACHE_TTL)
         return ProjectStructure(
             tracks=[
                 TrackSummary(
@@ -209,42 +400,47 @@ class AbletonClient:
         )
 
     async def set_tempo(self, tempo: float) -> float:
-        r = await _cmd(self._conn, "set_tempo", {"tempo": tempo})
-        return float(r["tempo"])
+        r = await self._write("set_tempo", {"tempo": tempo})
+        return r["tempo"]
 
     async def start_playing(self) -> None:
-        await _cmd(self._conn, "start_playback")
+        await self._write("start_playback")
 
     async def stop_playing(self) -> None:
-        await _cmd(self._conn, "stop_playback")
+        await self._write("stop_playback")
 
     async def create_midi_track(self, index: int = -1) -> str:
         """Create a MIDI track at a given index, defaults to end if index not provided"""
-        r = await _cmd(self._conn, "create_midi_track", {"index": index})
-        return str(r["name"])
+        r = await self._write("create_midi_track", {"index": index})
+        return r["name"]
 
     async def create_audio_track(self) -> str:
         """Create an audio track at the end"""
-        r = await _cmd(self._conn, "create_audio_track")
-        return str(r["name"])
+        r = await self._write("create_audio_track")
+        return r["name"]
 
     async def delete_track(self, index: int) -> int:
         """Delete a track at the provided index"""
-        r = await _cmd(self._conn, "delete_track", {"index": index})
-        return int(r["index"])
+        r = await self._write("delete_track", {"index": index})
+        return r["index"]
 
     # --- Track-level ---
 
     async def get_track_name(self, track_index: int) -> str:
-        r = await _cmd(self._conn, "get_track_devices", {"track_index": track_index})
-        return str(r["track_name"])
+        r = await self._read(
+            "get_track_devices", {"track_index": track_index}, ttl=NAME_CACHE_TTL
+        )
+        return r["track_name"]
 
     async def get_track_names(self, num_tracks: int) -> list[str]:
-        tasks = [self.get_track_name(i) for i in range(num_tracks)]
-        return list(await asyncio.gather(*tasks))
+        # One get_project_structure round trip carries every track name.
+        r = await self._read("get_project_structure", ttl=NAME_CACHE_TTL)
+        return [t["name"] for t in r["tracks"][:num_tracks]]
 
     async def get_track_devices(self, track_index: int) -> TrackDevices:
-        r = await _cmd(self._conn, "get_track_devices", {"track_index": track_index})
+        r = await self._read(
+            "get_track_devices", {"track_index": track_index}, ttl=TRACK_CACHE_TTL
+        )
         return TrackDevices(
             index=r["track_index"],
             name=r["track_name"],
@@ -252,7 +448,9 @@ class AbletonClient:
         )
 
     async def get_track_info(self, track_index: int) -> TrackInfo:
-        r = await _cmd(self._conn, "get_track_info", {"track_index": track_index})
+        r = await self._read(
+            "get_track_info", {"track_index": track_index}, ttl=TRACK_CACHE_TTL
+        )
         return TrackInfo(
             index=r["index"],
             name=r["name"],
@@ -265,8 +463,8 @@ class AbletonClient:
             solo=r.get("solo"),
             arm=r.get("arm"),
             is_frozen=bool(r.get("is_frozen", False)),
-            volume=float(r["volume"]),
-            panning=float(r["panning"]),
+            volume=r["volume"],
+            panning=r["panning"],
             devices=[
                 TrackDevice(index=d["index"], name=d["name"], class_name=d["class_name"])
                 for d in r.get("devices", [])
@@ -275,16 +473,18 @@ class AbletonClient:
         )
 
     async def get_arrangement_clips(self, track_index: int) -> TrackArrangementClips:
-        r = await _cmd(self._conn, "get_arrangement_clips", {"track_index": track_index})
+        r = await self._read(
+            "get_arrangement_clips", {"track_index": track_index}, ttl=TRACK_CACHE_TTL
+        )
         return TrackArrangementClips(
             track_index=r["track_index"],
             track_name=r["track_name"],
             clips=[
                 ArrangementClip(
                     name=c["name"],
-                    start_time=float(c["start_time"]),
-                    end_time=float(c["end_time"]),
-                    length=float(c["length"]),
+                    start_time=c["start_time"],
+                    end_time=c["end_time"],
+                    length=c["length"],
                     is_midi=bool(c.get("is_midi", False)),
                 )
                 for c in r.get("clips", [])
@@ -292,7 +492,9 @@ class AbletonClient:
         )
 
     async def get_session_clips(self, track_index: int) -> TrackSessionClips:
-        r = await _cmd(self._conn, "get_session_clips", {"track_index": track_index})
+        r = await self._read(
+            "get_session_clips", {"track_index": track_index}, ttl=TRACK_CACHE_TTL
+        )
         return TrackSessionClips(
             track_index=r["track_index"],
             track_name=r["track_name"],
@@ -300,7 +502,7 @@ class AbletonClient:
                 SessionClip(
                     slot_index=c["slot_index"],
                     name=c["name"],
-                    length=float(c["length"]),
+                    length=c["length"],
                     is_midi=bool(c.get("is_midi", True)),
                     is_playing=bool(c.get("is_playing", False)),
                     is_recording=bool(c.get("is_recording", False)),
@@ -312,12 +514,17 @@ class AbletonClient:
     # --- Device/parameter-level ---
 
     async def get_device_name(self, track_index: int, device_index: int) -> str:
-        r = await _cmd(
-            self._conn,
-            "get_device_parameters",
-            {"track_index": track_index, "device_index": device_index},
+        # get_track_devices lists every device name on the track without
+        # serialising parameters, and shares its cache entry with get_track_name.
+        r = await self._read(
+            "get_track_devices", {"track_index": track_index}, ttl=NAME_CACHE_TTL
         )
-        return str(r["device_name"])
+        devices = r["devices"]
+        if not 0 <= device_index < len(devices):
+            raise RuntimeError(
+                f"Device index {device_index} out of range on track {track_index}"
+            )
+        return devices[device_index]["name"]
 
     async def get_device_parameters(
         self,
@@ -328,18 +535,18 @@ class AbletonClient:
         logger.info(
             f"[ABLETON] get_parameters() track={track_index} device={device_index}"
         )
-        r = await _cmd(
-            self._conn,
+        r = await self._read(
             "get_device_parameters",
             {"track_index": track_index, "device_index": device_index},
+            ttl=PARAM_CACHE_TTL,
         )
         return [
-            ParameterData(
+            ParameterData.model_construct(
                 id=p["index"],
                 name=p["name"],
-                value=float(p["value"]),
-                min=float(p["min"]),
-                max=float(p["max"]),
+                value=p["value"],
+                min=p["min"],
+                max=p["max"],
                 value_string=p.get("value_string") if include_value_string else None,
             )
             for p in r["parameters"]
@@ -356,17 +563,37 @@ class AbletonClient:
             f"[ABLETON] set_parameter() track={track_index} device={device_index}"
             f" param={param_index} value={value}"
         )
-        r = await _cmd(
-            self._conn,
-            "set_device_parameter",
-            {
-                "track_index": track_index,
-                "device_index": device_index,
-                "parameter_index": param_index,
-                "value": value,
-            },
+        try:
+            r = await _cmd(
+                self._conn,
+                "set_device_parameter",
+                {
+                    "track_index": track_index,
+                    "device_index": device_index,
+                    "parameter_index": param_index,
+                    "value": value,
+                },
+            )
+        except Exception:
+            self._invalidate_cache()
+            raise
+        value_string = str(r.get("value_string", str(round(value, 4))))
+        # Only this parameter changed, so patch its cached device entry instead
+        # of dropping every cached read. Bumping the generation still stops
+        # reads that were in flight from caching pre-write values.
+        self._cache_generation += 1
+        self._inflight.clear()
+        key = _cache_key(
+            "get_device_parameters",
+            {"track_index": track_index, "device_index": device_index},
         )
-        return str(r.get("value_string", str(round(value, 4))))
+        hit = self._cache.get(key)
+        if hit is not None:
+            params = hit[1]["parameters"]
+            if 0 <= param_index < len(params):
+                params[param_index]["value"] = r.get("value", value)
+                params[param_index]["value_string"] = value_string
+        return value_string
 
     async def create_rack(self, track_index: int, rack_type: str) -> str:
         """Insert an empty Audio Effect Rack or Instrument Rack on a track.
@@ -377,8 +604,7 @@ class AbletonClient:
 
         Returns: Human-readable confirmation with the new rack's device index.
         """
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "create_rack",
             {"track_index": track_index, "rack_type": rack_type},
         )
@@ -404,8 +630,7 @@ class AbletonClient:
 
         Returns: Human-readable confirmation with the loaded device name and index.
         """
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "add_device_to_rack",
             {
                 "track_index": track_index,
@@ -423,21 +648,23 @@ class AbletonClient:
 
     async def get_clip_info(self, track_index: int, clip_index: int) -> ClipInfo | None:
         try:
-            r = await _cmd(self._conn, "get_track_info", {"track_index": track_index})
-            slots: list[dict[str, Any]] = r.get("clip_slots", [])
-            if clip_index >= len(slots):
-                return None
-            slot = slots[clip_index]
-            if not slot.get("has_clip"):
+            # get_session_clips returns only occupied slots, without the device
+            # list and empty slots that get_track_info would also serialise.
+            r = await self._read(
+                "get_session_clips", {"track_index": track_index}, ttl=TRACK_CACHE_TTL
+            )
+            clip = next(
+                (c for c in r.get("clips", []) if c["slot_index"] == clip_index), None
+            )
+            if clip is None:
                 return None
-            clip = slot["clip"]
             return ClipInfo(
                 clip_id=clip_index,
                 name=clip["name"],
-                length_beats=float(clip["length"]),
-                is_midi=True,
+                length_beats=clip["length"],
+                is_midi=bool(clip.get("is_midi", True)),
                 loop_start=0.0,
-                loop_end=float(clip["length"]),
+                loop_end=clip["length"],
                 gain=1.0,
             )
         except Exception as exc:
@@ -451,8 +678,7 @@ class AbletonClient:
         raise NotImplementedError
 
     async def delete_clip(self, track_index: int, clip_index: int) -> bool:
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "delete_clip",
             {"track_index": track_index, "clip_index": clip_index},
         )
@@ -461,52 +687,71 @@ class AbletonClient:
     async def create_session_clip(
         self, track_index: int, slot_index: int, length: float
     ) -> ClipInfo:
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "create_clip",
             {"track_index": track_index, "clip_index": slot_index, "length": length},
         )
         return ClipInfo(
             clip_id=slot_index,
             name=r["name"],
-            length_beats=float(r["length"]),
+            length_beats=r["length"],
             is_midi=True,
             loop_start=0.0,
-            loop_end=float(r["length"]),
+            loop_end=r["length"],
             gain=1.0,
         )
 
     async def add_notes_to_session_clip(
-        self, track_index: int, slot_index: int, notes: list[dict[str, Any]]
+        self, track_index: int, slot_index: int, notes: list[Note]
     ) -> int:
         """Add MIDI notes to a session-view clip slot.
 
-        Each note dict: pitch (int), start_time (float beats), duration (float beats),
-        velocity (int 0-127), mute (bool, optional).
         Returns the number of notes added.
         """
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "add_notes_to_clip",
-            {"track_index": track_index, "clip_index": slot_index, "notes": notes},
+            {
+                "track_index": track_index,
+                "clip_index": slot_index,
+                "notes": [note.model_dump() for note in notes],
+            },
         )
-        return int(r["note_count"])
+        return r["note_count"]
 
     async def add_notes_to_arrangement_clip(
-        self, track_index: int, clip_index: int, notes: list[dict[str, Any]]
+        self, track_index: int, clip_index: int, notes: list[Note]
     ) -> int:
         """Add MIDI notes to an arrangement clip.
 
-        Each note dict: pitch (int), start_time (float beats), duration (float beats),
-        velocity (int 0-127), mute (bool, optional).
         Returns the number of notes added.
         """
-        r = await _cmd(
-            self._conn,
+        r = await self._write(
             "add_notes_to_arrangement_clip",
-            {"track_index": track_index, "clip_index": clip_index, "notes": notes},
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "notes": [note.model_dump() for note in notes],
+            },
+        )
+        return r["note_count"]
+
+    async def fill_arrangement_section(
+        self, track_index: int, source_slot: int, start_beat: float, end_beat: float
+    ) -> int:
+        """Tile a session clip across [start_beat, end_beat) in the arrangement.
+
+        Returns the number of clips placed.
+        """
+        r = await self._write(
+            "fill_arrangement_section",
+            {
+                "track_index": track_index,
+                "source_slot": source_slot,
+                "start_beat": start_beat,
+                "end_beat": end_beat,
+            },
         )
-        return int(r["note_count"])
+        return r["clip_count"]
 
     # --- Sync/listener stubs ---
 
@@ -527,45 +772,49 @@ class AbletonClient:
 
     async def get_project_index(self) -> ProjectIndex:
         """Return the full project structure in a single round trip."""
-        r = await _cmd(self._conn, "get_project_index")
-        song_context = SongContext(
-            tempo=float(r["tempo"]),
-            time_sig_numerator=int(r["signature_numerator"]),
-            time_sig_denominator=int(r["signature_denominator"]),
-            num_tracks=int(r["track_count"]),
+        r = await self._read("get_project_index")
+        song_context = _song_context(
+            r["tempo"],
+            r["signature_numerator"],
+            r["signature_denominator"],
+            r["track_count"],
         )
-        tracks: list[TrackData] = []
-        for raw_track in r.get("tracks", []):
-            devices: list[DeviceData] = []
-            for raw_device in raw_track.get("devices", []):
-                params = [
-                    ParameterData(
-                        id=p["index"],
-                        name=p["name"],
-                        value=float(p["value"]),
-                        min=float(p["min"]),
-                        max=float(p["max"]),
-                        value_string=p.get("value_string"),
-                    )
-                    for p in raw_device.get("parameters", [])
-                ]
-                devices.append(
-                    DeviceData(
-                        id=raw_device["index"],
-                        name=raw_device["name"],
-                        class_name=raw_device["class_name"],
-                        parameters=params,
+        # The script's reply is trusted and can hold thousands of parameters, so
+        # the models are built without re-validating every field.
+        tracks = [
+            TrackData.model_construct(
+                id=rt["index"],
+                name=rt["name"],
+                devices=[
+                    DeviceData.model_construct(
+                        id=rd["index"],
+                        name=rd["name"],
+                        class_name=rd["class_name"],
+                        parameters=[
+                            ParameterData.model_construct(
+                                id=p["index"],
+                                name=p["name"],
+                                value=p["value"],
+                                min=p["min"],
+                                max=p["max"],
+                                value_string=p.get("value_string"),
+                            )
+                            for p in rd.get("parameters", ())
+                        ],
                     )
-                )
-            tracks.append(
-                TrackData(
-                    id=raw_track["index"],
-                    name=raw_track["name"],
-                    devices=devices,
-                )
+                    for rd in rt.get("devices", ())
+                ],
             )
+            for rt in r.get("tracks", ())
+        ]
         return ProjectIndex(song_context=song_context, tracks=tracks)
 
+    async def live_exec(self, code: str) -> None:
+        """Run a Python code block against Live's song on the main thread.
+
+        Raises ``RuntimeError`` carrying the script's message if the code fails.
+        """
+        await self._write("live_exec", {"code": code})
 
     async def send_raw_command(self, cmd_type: str, params: dict[str, Any]) -> str:
         """Send an arbitrary command to the MIDI script and return the raw response as JSON.
@@ -574,7 +823,11 @@ class AbletonClient:
         response (including error messages) is returned so the agent can reason
         about failures.
         """
-        resp = await self._conn.send({"type": cmd_type, "params": params})
+        try:
+            resp = await self._conn.send({"type": cmd_type, "params": params})
+        finally:
+            # Raw commands may mutate anything (e.g. live_exec).
+            self._invalidate_cache()
         return _json.dumps(resp, indent=2)
 
 
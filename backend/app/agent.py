@@ -1,5 +1,9 @@
+import asyncio
+import itertools
 import json
-import uuid
+import os
+import secrets
+import time
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Dict
 
@@ -11,6 +15,7 @@ from pydantic_ai import (
     DeferredToolResults,
     FunctionToolCallEvent,
     FunctionToolResultEvent,
+    ModelMessage,
     ModelRequest,
     ModelResponse,
     PartDeltaEvent,
@@ -24,6 +29,7 @@ from pydantic_ai import (
     UserPromptPart,
 )
 from pydantic_ai.messages import TextPart as MsgTextPart
+from pydantic_ai.models.anthropic import AnthropicModelSettings
 
 from .ableton_client import AbletonClient
 from .db.chat_repository import ChatRepository
@@ -48,6 +54,7 @@ from .formatting import (
 )
 from .live_docs import search as search_live_docs
 from .logger import logger
+from .models import Note
 
 SYSTEM_PROMPT = """You are a music production assistant embedded inside Ableton Live. You have
 direct access to the user's session and can read and modify it in real time.
@@ -344,17 +351,12 @@ Only reach for `send_raw_command` when:
 
 Command format: `{"type": "command_type", "params": {"key": "value"}}`
 
-Registered read commands: `get_session_info`, `get_project_structure`,
-`get_track_info`, `get_track_devices`, `get_device_parameters`,
-`get_arrangement_clips`, `get_session_clips`, `get_project_index`,
-`get_browser_item`, `get_browser_tree`, `get_browser_items_at_path`,
-`live_eval` (see below).
-
-Registered write commands: `set_tempo`, `set_track_name`, `set_device_parameter`,
-`create_midi_track`, `create_audio_track`, `delete_track`, `create_clip`,
-`delete_clip`, `add_notes_to_clip`, `add_notes_to_arrangement_clip`,
-`set_clip_name`, `fire_clip`, `stop_clip`, `start_playback`, `stop_playback`,
-`load_browser_item`, `create_rack`, `add_device_to_rack`, `live_exec` (see below).
+Registered commands with no dedicated tool (every other command has one):
+- Read: `get_track_devices`, `get_project_index`, `get_browser_item`,
+  `get_browser_tree`, `get_browser_items_at_path`, `live_eval` (see below).
+- Write: `set_tempo`, `set_track_name`, `create_midi_track`, `create_audio_track`,
+  `delete_track`, `delete_clip`, `set_clip_name`, `fire_clip`, `stop_clip`,
+  `start_playback`, `stop_playback`, `load_browser_item`, `live_exec` (see below).
 
 **Generic escape hatches** for anything not covered by a registered command:
 - `live_eval` — read any Live API value: `{"expr": "song.tracks[0].name"}`
@@ -401,13 +403,15 @@ which tool to use and prevents confusing "no arrangement clips" errors.
    it gives the full track list with types, group nesting, and mute/solo state
    in one round trip, without the cost of fetching devices or clips.
 3. Call `get_track_info()` before `get_device_params()` — you need the
-   device list before you can inspect parameters.
+   device list before you can inspect parameters. To inspect several tracks,
+   call `get_tracks_info(track_indices)` once instead of `get_track_info()`
+   per track; it fetches them concurrently.
 4. Call `get_device_params()` before `set_device_param()` — you need the
    current parameter values and names before modifying anything.
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDeps:
     project_id: int
     ableton_client: AbletonClient
@@ -420,6 +424,12 @@ ableton_agent = Agent(
     system_prompt=SYSTEM_PROMPT,
     deps_type=AgentDeps,
     output_type=[str, DeferredToolRequests],
+    # The system prompt and tool schemas are identical on every request, so
+    # let Anthropic serve them from its prompt cache instead of re-prefilling.
+    model_settings=AnthropicModelSettings(
+        anthropic_cache_instructions=True,
+        anthropic_cache_tool_definitions=True,
+    ),
 )
 
 
@@ -561,7 +571,9 @@ async def get_track_info(ctx: RunContext[AgentDeps], track_index: int) -> str:
         if not current.is_grouped or current.group_index is None:
             break
         try:
-            group_info = await ctx.deps.ableton_client.get_track_info(current.group_index)
+            group_info = await ctx.deps.ableton_client.get_track_info(
+                current.group_index
+            )
         except RuntimeError:
             break
         sections.append(format_track_info(group_info, label="Parent group"))
@@ -571,20 +583,63 @@ async def get_track_info(ctx: RunContext[AgentDeps], track_index: int) -> str:
 
 
 @ableton_agent.tool
-async def get_arrangement_clips(ctx: RunContext[AgentDeps], track_index: int) -> str:
-    """Get all arrangement-view clips on a track with names, beat positions, and type.
+async def get_tracks_info(ctx: RunContext[AgentDeps], track_indices: list[int]) -> str:
+    """Get full information for several tracks at once, fetched concurrently.
+
+    Returns the same per-track details as get_track_info, without the parent group
+    sections. Prefer this over repeated get_track_info calls when inspecting more
+    than one track.
+
+    Args:
+        track_indices: 0-indexed track positions.
+    """
+
+    async def one(track_index: int) -> str:
+        try:
+            info = await ctx.deps.ableton_client.get_track_info(track_index)
+        except RuntimeError as e:
+            return f"Track {track_index}: {e}"
+        return format_track_info(info)
+
+    sections = await asyncio.gather(*(one(i) for i in track_indices))
+    return "\n\n".join(sections)
+
+
+_ARRANGEMENT_CLIPS_PAGE_SIZE = 50
+
+
+@ableton_agent.tool
+async def get_arrangement_clips(
+    ctx: RunContext[AgentDeps], track_index: int, page: int = 0
+) -> str:
+    """Get arrangement-view clips on a track with names, beat positions, and type.
     Only works on regular MIDI/audio tracks — group and return tracks will return an error.
     Use this when the user is in Arrangement view or asks about arrangement structure.
+    Long tracks are returned 50 clips per page; the result says when more pages exist.
+    Each clip is prefixed with its [clip_index] for the other arrangement tools.
 
     Args:
         track_index: 0-indexed track position.
+        page: 0-indexed page of clips to return.
     """
     try:
         data = await ctx.deps.ableton_client.get_arrangement_clips(track_index)
-        return format_arrangement_clips(data)
     except RuntimeError as e:
         return str(e)
 
+    total = len(data.clips)
+    if total <= _ARRANGEMENT_CLIPS_PAGE_SIZE:
+        return format_arrangement_clips(data)
+    start = page * _ARRANGEMENT_CLIPS_PAGE_SIZE
+    if not 0 <= start < total:
+        return f"Page {page} is out of range: track {track_index} has {total} clips."
+    end = min(start + _ARRANGEMENT_CLIPS_PAGE_SIZE, total)
+    text = format_arrangement_clips(data, start, end)
+    text += f"\nShowing clips {start}–{end - 1} of {total}."
+    if end < total:
+        text += f" Call get_arrangement_clips(track_index, page={page + 1}) for more."
+    return text
+
 
 @ableton_agent.tool
 async def get_session_clips(ctx: RunContext[AgentDeps], track_index: int) -> str:
@@ -722,6 +777,9 @@ async def search_live_api(ctx: RunContext[AgentDeps], query: str) -> str:
     return search_live_docs(query)
 
 
+_APPROVAL_REQUIRED_CMDS = frozenset({"live_exec", "delete_track", "delete_clip"})
+
+
 @ableton_agent.tool
 async def send_raw_command(
     ctx: RunContext[AgentDeps],
@@ -750,12 +808,37 @@ async def send_raw_command(
         cmd_type: The command type string (e.g. "fire_clip", "live_eval").
         params: Command parameters as a dict.
     """
-    _APPROVAL_REQUIRED_CMDS = {"live_exec", "delete_track", "delete_clip"}
     if cmd_type in _APPROVAL_REQUIRED_CMDS and not ctx.tool_call_approved:
         raise ApprovalRequired()
     return await ctx.deps.ableton_client.send_raw_command(cmd_type, params)
 
 
+# live_exec code for the arrangement tools; only the arguments change per call.
+_CLEAR_ARRANGEMENT_CODE = (
+    "t = song.tracks[{track}]\n"
+    "for c in reversed(list(t.arrangement_clips)):\n"
+    "    t.delete_clip(c)"
+)
+_DELETE_ARRANGEMENT_CLIP_CODE = (
+    "t = song.tracks[{track}]\nt.delete_clip(t.arrangement_clips[{clip}])"
+)
+_CREATE_MIDI_CLIP_CODE = (
+    "t = song.tracks[{track}]\nt.create_midi_clip({start}, {length})"
+)
+_CREATE_AUDIO_CLIP_CODE = (
+    "t = song.tracks[{track}]\nt.create_audio_clip({path}, {start})"
+)
+
+
+async def _run_live_exec(ctx: RunContext[AgentDeps], code: str, done: str) -> str:
+    """Run *code* with live_exec and return *done*, or the error for the agent."""
+    try:
+        await ctx.deps.ableton_client.live_exec(code)
+    except RuntimeError as e:
+        return f"Error: {e}"
+    return done
+
+
 @ableton_agent.tool
 async def fill_arrangement_section(
     ctx: RunContext[AgentDeps],
@@ -776,20 +859,16 @@ async def fill_arrangement_section(
         start_beat: First beat position to place a clip (0 = beginning of arrangement).
         end_beat: Stop placing clips once this beat is reached (exclusive).
     """
-    code = (
-        f"t = song.tracks[{track_index}]\n"
-        f"src = t.clip_slots[{source_slot}].clip\n"
-        f"clip_len = src.length\n"
-        f"pos = {float(start_beat)}\n"
-        f"while pos < {float(end_beat)}:\n"
-        f"    t.duplicate_clip_to_arrangement(src, pos)\n"
-        f"    pos += clip_len"
+    try:
+        count = await ctx.deps.ableton_client.fill_arrangement_section(
+            track_index, source_slot, start_beat, end_beat
+        )
+    except RuntimeError as e:
+        return f"Error: {e}"
+    return (
+        f"Filled track {track_index} from beat {start_beat} to {end_beat}"
+        f" ({count} clips)"
     )
-    raw = await ctx.deps.ableton_client.send_raw_command("live_exec", {"code": code})
-    result = json.loads(raw)
-    if result.get("status") == "error":
-        return f"Error: {result.get('message')}"
-    return f"Filled track {track_index} from beat {start_beat} to {end_beat}"
 
 
 @ableton_agent.tool(requires_approval=True)
@@ -805,16 +884,10 @@ async def clear_track_arrangement(
     Args:
         track_index: 0-indexed track position.
     """
-    code = (
-        f"t = song.tracks[{track_index}]\n"
-        f"for c in list(t.arrangement_clips):\n"
-        f"    t.delete_clip(c)"
+    code = _CLEAR_ARRANGEMENT_CODE.format(track=track_index)
+    return await _run_live_exec(
+        ctx, code, f"Cleared all arrangement clips on track {track_index}"
     )
-    raw = await ctx.deps.ableton_client.send_raw_command("live_exec", {"code": code})
-    result = json.loads(raw)
-    if result.get("status") == "error":
-        return f"Error: {result.get('message')}"
-    return f"Cleared all arrangement clips on track {track_index}"
 
 
 @ableton_agent.tool(requires_approval=True)
@@ -832,15 +905,10 @@ async def delete_arrangement_clip(
         track_index: 0-indexed track position.
         clip_index: 0-indexed position in track.arrangement_clips (from get_arrangement_clips).
     """
-    code = (
-        f"t = song.tracks[{track_index}]\n"
-        f"t.delete_clip(t.arrangement_clips[{clip_index}])"
+    code = _DELETE_ARRANGEMENT_CLIP_CODE.format(track=track_index, clip=clip_index)
+    return await _run_live_exec(
+        ctx, code, f"Deleted arrangement clip {clip_index} on track {track_index}"
     )
-    raw = await ctx.deps.ableton_client.send_raw_command("live_exec", {"code": code})
-    result = json.loads(raw)
-    if result.get("status") == "error":
-        return f"Error: {result.get('message')}"
-    return f"Deleted arrangement clip {clip_index} on track {track_index}"
 
 
 @ableton_agent.tool
@@ -859,15 +927,14 @@ async def create_midi_arrangement_clip(
         start_beat: Beat position where the clip starts (0 = arrangement start).
         length: Clip length in beats.
     """
-    code = (
-        f"t = song.tracks[{track_index}]\n"
-        f"t.create_midi_clip({float(start_beat)}, {float(length)})"
+    code = _CREATE_MIDI_CLIP_CODE.format(
+        track=track_index, start=start_beat, length=length
+    )
+    return await _run_live_exec(
+        ctx,
+        code,
+        f"Created MIDI clip on track {track_index} at beat {start_beat}, length {length}",
     )
-    raw = await ctx.deps.ableton_client.send_raw_command("live_exec", {"code": code})
-    result = json.loads(raw)
-    if result.get("status") == "error":
-        return f"Error: {result.get('message')}"
-    return f"Created MIDI clip on track {track_index} at beat {start_beat}, length {length}"
 
 
 @ableton_agent.tool
@@ -887,16 +954,14 @@ async def create_audio_arrangement_clip(
         file_path: Absolute path to the audio file.
         start_beat: Beat position where the clip starts (0 = arrangement start).
     """
-    escaped_path = json.dumps(file_path)
-    code = (
-        f"t = song.tracks[{track_index}]\n"
-        f"t.create_audio_clip({escaped_path}, {float(start_beat)})"
+    code = _CREATE_AUDIO_CLIP_CODE.format(
+        track=track_index, path=json.dumps(file_path), start=start_beat
+    )
+    return await _run_live_exec(
+        ctx,
+        code,
+        f"Created audio clip on track {track_index} at beat {start_beat} from {file_path}",
     )
-    raw = await ctx.deps.ableton_client.send_raw_command("live_exec", {"code": code})
-    result = json.loads(raw)
-    if result.get("status") == "error":
-        return f"Error: {result.get('message')}"
-    return f"Created audio clip on track {track_index} at beat {start_beat} from {file_path}"
 
 
 @ableton_agent.tool
@@ -932,13 +997,13 @@ async def add_notes_to_session_clip(
     ctx: RunContext[AgentDeps],
     track_index: int,
     slot_index: int,
-    notes: list[dict],
+    notes: list[Note],
 ) -> str:
     """Add MIDI notes to a session-view clip.
 
     The clip must already exist in the slot — create it with create_session_clip if needed.
 
-    Each note is a dict with:
+    Each note has:
       - pitch: int, MIDI note number (0–127, e.g. 60 = C3)
       - start_time: float, beat offset from the clip's start
       - duration: float, note length in beats
@@ -948,7 +1013,7 @@ async def add_notes_to_session_clip(
     Args:
         track_index: 0-indexed track position.
         slot_index: 0-indexed clip slot.
-        notes: List of note dicts.
+        notes: Notes to add.
     """
     try:
         count = await ctx.deps.ableton_client.add_notes_to_session_clip(
@@ -964,14 +1029,14 @@ async def add_notes_to_arrangement_clip(
     ctx: RunContext[AgentDeps],
     track_index: int,
     clip_index: int,
-    notes: list[dict],
+    notes: list[Note],
 ) -> str:
     """Add MIDI notes to an arrangement clip.
 
     Call get_arrangement_clips first to confirm the clip exists and is MIDI.
     The clip must already exist — create it with create_midi_arrangement_clip if needed.
 
-    Each note is a dict with:
+    Each note has:
       - pitch: int, MIDI note number (0–127, e.g. 60 = C3)
       - start_time: float, beat offset from the clip's start
       - duration: float, note length in beats
@@ -981,7 +1046,7 @@ async def add_notes_to_arrangement_clip(
     Args:
         track_index: 0-indexed track position.
         clip_index: 0-indexed position in track.arrangement_clips.
-        notes: List of note dicts.
+        notes: Notes to add.
     """
     try:
         count = await ctx.deps.ableton_client.add_notes_to_arrangement_clip(
@@ -1005,18 +1070,85 @@ async def load_skill(ctx: RunContext[AgentDeps], name: str) -> str:
     return ctx.deps.skill_registry.load_body(name)
 
 
+# Consecutive text deltas are merged into one TextDeltaEvent until this many
+# characters are buffered or this many seconds have passed since the first.
+_TEXT_FLUSH_CHARS = 64
+_TEXT_FLUSH_INTERVAL = 0.015
+
+_DENIED_MESSAGE = "User denied this action."
+_DENIED_REPLY = "Okay, I won't make that change."
+
+# Run ids only need to be unique within this process: a per-process nonce
+# plus a counter shared by every ChatService.
+_RUN_NONCE = secrets.token_hex(4)
+_run_ids = itertools.count()
+
+
 class ChatService:
     def __init__(
         self,
         chat_repo: ChatRepository,
         ableton_client: AbletonClient,
         skill_registry: SkillRegistry,
+        short_circuit_denials: bool | None = None,
     ):
         self.chat_repo = chat_repo
         self.ableton_client = ableton_client
         self.skill_registry = skill_registry
+        # When the user denies every pending tool call, answer locally instead
+        # of sending the denials back to the model. Off unless enabled with the
+        # SHORT_CIRCUIT_DENIALS setting, since the model then never sees them.
+        if short_circuit_denials is None:
+            setting = os.getenv("SHORT_CIRCUIT_DENIALS", "")
+            short_circuit_denials = setting.lower() in ("1", "true", "yes")
+        self.short_circuit_denials = short_circuit_denials
         # Holds DeferredToolRequests for sessions paused waiting for approval.
         self._pending_deferred: dict[str, DeferredToolRequests] = {}
+        # Last history saved or loaded per session, so each turn doesn't
+        # re-read and re-validate the whole history from the database.
+        self._history: dict[str, list[ModelMessage]] = {}
+        # History writes run after the final event is sent to the client. Only
+        # the newest unsaved history per session is written, since each save
+        # replaces the whole history anyway.
+        self._save_tasks: dict[str, asyncio.Task[None]] = {}
+        self._unsaved: dict[str, list[ModelMessage]] = {}
+
+    def _load_history(self, session_id: str) -> list[ModelMessage]:
+        history = self._history.get(session_id)
+        if history is None:
+            history = self.chat_repo.load_message_history(session_id)
+            self._history[session_id] = history
+        return history
+
+    def _save_history(self, session_id: str, messages: list[ModelMessage]) -> None:
+        self._history[session_id] = messages
+        self._unsaved[session_id] = messages
+        if session_id in self._save_tasks:
+            # The write already scheduled for this session will pick this
+            # history up instead of the older one.
+            return
+        task = asyncio.create_task(self._persist_history(session_id))
+        self._save_tasks[session_id] = task
+        task.add_done_callback(lambda _: self._save_tasks.pop(session_id, None))
+
+    async def _persist_history(self, session_id: str) -> None:
+        messages = self._unsaved.pop(session_id)
+        try:
+            self.chat_repo.save_message_history(session_id, messages)
+        # Runs as a background task, so anything that escaped here would be
+        # lost with the history, or resurface from flush_saves in the
+        # websocket's cleanup and mask why the connection closed.
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Failed to save history | session={session_id}")
+            # Leave it unsaved so flush_saves retries the write.
+            self._unsaved[session_id] = messages
+
+    async def flush_saves(self) -> None:
+        """Wait for in-flight history writes, then retry any that failed."""
+        if self._save_tasks:
+            await asyncio.gather(*self._save_tasks.values())
+        for session_id in list(self._unsaved):
+            await self._persist_history(session_id)
 
     async def _run_agent_stream(
         self,
@@ -1034,57 +1166,94 @@ class ChatService:
         _pending_deferred and yields an ApprovalRequestEvent — the caller must
         NOT yield EndEvent in that case.
         """
-        async for event in ableton_agent.run_stream_events(
-            user_prompt,
-            message_history=message_history,
-            deferred_tool_results=deferred_tool_results,
-            deps=deps,
-        ):
-            if isinstance(event, FunctionToolCallEvent):
-                logger.info(
-                    f"Tool call: {event.part.tool_name}; Tool call ID: {event.tool_call_id}"
-                )
-                yield ToolCallEvent(
-                    run_id=run_id,
-                    content=event.part.tool_name,
-                    arguments=event.part.args_as_dict(),
-                    tool_call_id=event.tool_call_id,
-                )
-            elif isinstance(event, FunctionToolResultEvent):
-                if isinstance(event.result, ToolReturnPart):
+        pending_text: list[str] = []
+        pending_chars = 0
+        flush_at = 0.0
+        try:
+            async for event in ableton_agent.run_stream_events(
+                user_prompt,
+                message_history=message_history,
+                deferred_tool_results=deferred_tool_results,
+                deps=deps,
+            ):
+                # Text deltas make up nearly every event, so test for them first.
+                if isinstance(event, PartDeltaEvent):
+                    if (
+                        isinstance(event.delta, TextPartDelta)
+                        and event.delta.content_delta
+                    ):
+                        if not pending_text:
+                            flush_at = time.monotonic() + _TEXT_FLUSH_INTERVAL
+                        pending_text.append(event.delta.content_delta)
+                        pending_chars += len(event.delta.content_delta)
+                        if (
+                            pending_chars >= _TEXT_FLUSH_CHARS
+                            or time.monotonic() >= flush_at
+                        ):
+                            yield TextDeltaEvent(
+                                run_id=run_id, content="".join(pending_text)
+                            )
+                            pending_text.clear()
+                            pending_chars = 0
+                    continue
+
+                # Any other event flushes buffered text first so ordering is kept.
+                if pending_text:
+                    yield TextDeltaEvent(run_id=run_id, content="".join(pending_text))
+                    pending_text.clear()
+                    pending_chars = 0
+
+                if isinstance(event, FunctionToolCallEvent):
                     logger.info(
-                        f"Tool result: {event.result.tool_name}; Tool call ID: {event.tool_call_id}"
+                        "Tool call: %s; Tool call ID: %s",
+                        event.part.tool_name,
+                        event.tool_call_id,
                     )
-                    yield ToolResultEvent(
+                    yield ToolCallEvent(
                         run_id=run_id,
+                        content=event.part.tool_name,
+                        arguments=event.part.args_as_dict(),
                         tool_call_id=event.tool_call_id,
-                        content=event.result.model_response_str(),
-                    )
-            elif isinstance(event, PartStartEvent):
-                if isinstance(event.part, TextPart) and event.part.content:
-                    yield TextDeltaEvent(run_id=run_id, content=event.part.content)
-            elif isinstance(event, PartDeltaEvent):
-                if isinstance(event.delta, TextPartDelta) and event.delta.content_delta:
-                    yield TextDeltaEvent(
-                        run_id=run_id, content=event.delta.content_delta
-                    )
-            elif isinstance(event, AgentRunResultEvent):
-                self.chat_repo.save_message_history(
-                    session_id, event.result.all_messages()
-                )
-                if isinstance(event.result.output, DeferredToolRequests):
-                    self._pending_deferred[session_id] = event.result.output
-                    yield ApprovalRequestEvent(
-                        run_id=run_id,
-                        requests=[
-                            ApprovalRequest(
-                                tool_call_id=call.tool_call_id,
-                                tool_name=call.tool_name,
-                                arguments=call.args_as_dict(),
-                            )
-                            for call in event.result.output.approvals
-                        ],
                     )
+                elif isinstance(event, FunctionToolResultEvent):
+                    if isinstance(event.result, ToolReturnPart):
+                        logger.info(
+                            "Tool result: %s; Tool call ID: %s",
+                            event.result.tool_name,
+                            event.tool_call_id,
+                        )
+                        yield ToolResultEvent(
+                            run_id=run_id,
+                            tool_call_id=event.tool_call_id,
+                            content=event.result.model_response_str(),
+                        )
+                elif isinstance(event, PartStartEvent):
+                    if isinstance(event.part, TextPart) and event.part.content:
+                        yield TextDeltaEvent(run_id=run_id, content=event.part.content)
+                elif isinstance(event, AgentRunResultEvent):
+                    self._save_history(session_id, event.result.all_messages())
+                    if isinstance(event.result.output, DeferredToolRequests):
+                        self._pending_deferred[session_id] = event.result.output
+                        yield ApprovalRequestEvent(
+                            run_id=run_id,
+                            requests=[
+                                ApprovalRequest(
+                                    tool_call_id=call.tool_call_id,
+                                    tool_name=call.tool_name,
+                                    arguments=call.args_as_dict(),
+                                )
+                                for call in event.result.output.approvals
+                            ],
+                        )
+        except Exception:
+            # Send the text generated so far before the caller reports the
+            # error, so the reply isn't cut short.
+            if pending_text:
+                yield TextDeltaEvent(run_id=run_id, content="".join(pending_text))
+            raise
+
+        if pending_text:
+            yield TextDeltaEvent(run_id=run_id, content="".join(pending_text))
 
     async def process_message(
         self,
@@ -1093,13 +1262,16 @@ class ChatService:
         message: Dict[str, Any],
     ) -> AsyncGenerator[AgentEvent, None]:
         """Process a message and yield response chunks for the websocket."""
-        run_id = str(uuid.uuid4())
+        run_id = f"{_RUN_NONCE}-{next(_run_ids)}"
         if not self.chat_repo.get_chat_session(session_id):
             logger.error(f"Session not found: {session_id}")
             yield ModelErrorEvent(run_id=run_id, content="No active session")
             return
 
         logger.info(f"Processing message for session {session_id}")
+        # A new message supersedes any approval the user never answered; drop it
+        # so it isn't kept around for the life of the connection.
+        self._pending_deferred.pop(session_id, None)
 
         deps = AgentDeps(
             project_id=project_id,
@@ -1112,7 +1284,7 @@ class ChatService:
                 run_id,
                 session_id,
                 message["content"],
-                self.chat_repo.load_message_history(session_id),
+                self._load_history(session_id),
                 deps,
             ):
                 yield agent_event
@@ -1127,6 +1299,60 @@ class ChatService:
         if session_id not in self._pending_deferred:
             yield EndEvent(run_id=run_id)
 
+    def _all_denied(
+        self,
+        session_id: str,
+        pending: DeferredToolRequests,
+        approvals: dict[str, bool],
+    ) -> bool:
+        """Whether every tool call in the paused response was denied.
+
+        Calls that didn't need approval are only run when the agent resumes,
+        so any of those means the run has to go back through the agent.
+        """
+        if not pending.approvals or pending.calls:
+            return False
+        if any(approvals.get(call.tool_call_id) for call in pending.approvals):
+            return False
+        history = self._load_history(session_id)
+        if not history or not isinstance(history[-1], ModelResponse):
+            return False
+        pending_ids = {call.tool_call_id for call in pending.approvals}
+        return all(call.tool_call_id in pending_ids for call in history[-1].tool_calls)
+
+    def _deny_all(
+        self, run_id: str, session_id: str, pending: DeferredToolRequests
+    ) -> list[AgentEvent]:
+        """Record every pending tool call as denied without calling the model.
+
+        Appends the denied tool returns and a canned reply to the history, the
+        same shape the agent would have saved, and returns the events to send.
+        """
+        returns = [
+            ToolReturnPart(
+                tool_name=call.tool_name,
+                content=_DENIED_MESSAGE,
+                tool_call_id=call.tool_call_id,
+            )
+            for call in pending.approvals
+        ]
+        self._save_history(
+            session_id,
+            [
+                *self._load_history(session_id),
+                ModelRequest(parts=returns),
+                ModelResponse(parts=[TextPart(content=_DENIED_REPLY)]),
+            ],
+        )
+        events: list[AgentEvent] = [
+            ToolResultEvent(
+                run_id=run_id, tool_call_id=part.tool_call_id, content=_DENIED_MESSAGE
+            )
+            for part in returns
+        ]
+        events.append(TextDeltaEvent(run_id=run_id, content=_DENIED_REPLY))
+        return events
+
     async def resume_with_approvals(
         self,
         session_id: str,
@@ -1137,7 +1363,7 @@ class ChatService:
 
         approvals maps tool_call_id to True (approved) or False (denied).
         """
-        run_id = str(uuid.uuid4())
+        run_id = f"{_RUN_NONCE}-{next(_run_ids)}"
         pending = self._pending_deferred.pop(session_id, None)
         if pending is None:
             yield ModelErrorEvent(
@@ -1146,9 +1372,17 @@ class ChatService:
             )
             return
 
+        if self.short_circuit_denials and self._all_denied(
+            session_id, pending, approvals
+        ):
+            for agent_event in self._deny_all(run_id, session_id, pending):
+                yield agent_event
+            yield EndEvent(run_id=run_id)
+            return
+
         results = DeferredToolResults(
             approvals={
-                call_id: True if approved else ToolDenied("User denied this action.")
+                call_id: True if approved else ToolDenied(_DENIED_MESSAGE)
                 for call_id, approved in approvals.items()
             }
         )
@@ -1163,7 +1397,7 @@ class ChatService:
                 run_id,
                 session_id,
                 None,
-                self.chat_repo.load_message_history(session_id),
+                self._load_history(session_id),
                 deps,
                 deferred_tool_results=results,
             ):
@@ -1188,22 +1422,25 @@ class ChatService:
         Tool results are merged into their corresponding tool call entry (matched by
         tool_call_id), mirroring how they are rendered in the real-time stream.
         """
-        model_messages = self.chat_repo.load_message_history(session_id)
+        model_messages = self._load_history(session_id)
         result: list[dict] = []
+        append = result.append
         # Keyed by tool_call_id so we can attach results to their call entry later.
         tool_call_by_id: dict[str, dict] = {}
 
         for i, msg in enumerate(model_messages):
+            # Requests saved by older versions may have no timestamp.
+            ts = int(msg.timestamp.timestamp() * 1000) if msg.timestamp else 0
             if isinstance(msg, ModelRequest):
                 for part in msg.parts:
                     if isinstance(part, UserPromptPart):
-                        result.append(
+                        append(
                             {
                                 "id": i,
                                 "text": part.content,
                                 "isUser": True,
                                 "type": "text",
-                                "timestamp": int(msg.timestamp.timestamp() * 1000),  # pyright: ignore
+                                "timestamp": ts,
                             }
                         )
                     elif isinstance(part, ToolReturnPart):
@@ -1223,18 +1460,18 @@ class ChatService:
                             "type": "function_call",
                             "arguments": part.args_as_dict(),
                             "tool_call_id": part.tool_call_id,
-                            "timestamp": int(msg.timestamp.timestamp() * 1000),
+                            "timestamp": ts,
                         }
-                        result.append(entry)
+                        append(entry)
                         tool_call_by_id[part.tool_call_id] = entry
                 if text_parts:
-                    result.append(
+                    append(
                         {
                             "id": i,
                             "text": "".join(text_parts),
                             "isUser": False,
                             "type": "text",
-                            "timestamp": int(msg.timestamp.timestamp() * 1000),
+                            "timestamp": ts,
                         }
                     )
         return result
@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from fastapi import Depends
 from pydantic_ai import ModelMessage
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from . import get_db
@@ -39,10 +40,15 @@ class ChatRepository:
         """Serialize and persist pydantic-ai message history for a session."""
         from pydantic_core import to_jsonable_python
 
-        self.db.query(ChatSession).filter(ChatSession.id == session_id).update(
-            {"message_history": to_jsonable_python(messages)}
-        )
-        self.db.commit()
+        try:
+            self.db.query(ChatSession).filter(ChatSession.id == session_id).update(
+                {"message_history": to_jsonable_python(messages)}
+            )
+            self.db.commit()
+        except SQLAlchemyError:
+            # Leave the session usable so the write can be retried.
+            self.db.rollback()
+            raise
 
     def load_message_history(self, session_id: str) -> list[ModelMessage]:
         """Load and deserialize pydantic-ai message history for a session."""
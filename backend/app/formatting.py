@@ -1,10 +1,20 @@
 """Formatting and unit-conversion helpers for Ableton data."""
 
 import math
+from functools import lru_cache
 
-from .models import ParameterData, ProjectStructure, SongContext, TrackArrangementClips, TrackDevices, TrackInfo, TrackSessionClips
+from .models import (
+    ParameterData,
+    ProjectStructure,
+    SongContext,
+    TrackArrangementClips,
+    TrackDevices,
+    TrackInfo,
+    TrackSessionClips,
+)
 
 
+@lru_cache(maxsize=4096)
 def volume_to_db(value: float) -> str:
     """Convert 0-1 volume to dB string."""
     if value <= 0:
@@ -13,6 +23,7 @@ def volume_to_db(value: float) -> str:
     return f"{db:.1f} dB"
 
 
+@lru_cache(maxsize=4096)
 def pan_to_string(value: float) -> str:
     """Convert -1 to 1 panning to string."""
     if value == 0:
@@ -23,12 +34,13 @@ def pan_to_string(value: float) -> str:
     return f"R{percentage}"
 
 
+_NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_PITCH_NAMES = tuple(f"{_NOTE_NAMES[p % 12]}{p // 12 - 1}" for p in range(128))
+
+
 def pitch_to_note_name(pitch: int) -> str:
     """Convert MIDI pitch (0-127) to note name."""
-    notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    note = notes[pitch % 12]
-    octave = pitch // 12 - 1
-    return f"{note}{octave}"
+    return _PITCH_NAMES[pitch]
 
 
 def beats_to_bars(beats: float, time_sig_numerator: int = 4) -> float:
@@ -36,6 +48,7 @@ def beats_to_bars(beats: float, time_sig_numerator: int = 4) -> float:
     return beats / time_sig_numerator
 
 
+@lru_cache(maxsize=4096)
 def format_bar_length(beats: float, time_sig_numerator: int = 4) -> str:
     """Format length as bars string."""
     bars = beats_to_bars(beats, time_sig_numerator)
@@ -62,8 +75,7 @@ def format_track_devices(track_data: TrackDevices) -> str:
 
 def format_device_params(params: list[ParameterData]) -> str:
     """Format device parameters as compact key=value string for LLM."""
-    param_strs = [f"{p.name}={p.value_string}" for p in params if p.value_string]
-    return ", ".join(param_strs)
+    return ", ".join(f"{p.name}={p.value_string}" for p in params if p.value_string)
 
 
 def format_track_info(info: TrackInfo, label: str | None = None) -> str:
@@ -76,7 +88,16 @@ def format_track_info(info: TrackInfo, label: str | None = None) -> str:
         track_type = "Audio"
     else:
         track_type = "Return"
-    flags = [f for f, v in [("muted", info.mute), ("solo", info.solo), ("armed", info.arm), ("frozen", info.is_frozen)] if v]
+    flags = [
+        f
+        for f, v in [
+            ("muted", info.mute),
+            ("solo", info.solo),
+            ("armed", info.arm),
+            ("frozen", info.is_frozen),
+        ]
+        if v
+    ]
     header_label = f"{label}: " if label else ""
     lines = [
         f"{header_label}Track [{info.index}]: {info.name} ({track_type})",
@@ -107,22 +128,38 @@ def format_session_clips(data: TrackSessionClips) -> str:
     """Format session clips as compact summary for LLM."""
     if not data.clips:
         return f"Track [{data.track_index}] '{data.track_name}': no session clips"
-    lines = [f"Track [{data.track_index}] '{data.track_name}': {len(data.clips)} session clip(s)"]
+    lines = [
+        f"Track [{data.track_index}] '{data.track_name}': {len(data.clips)} session clip(s)"
+    ]
     for c in data.clips:
         kind = "MIDI" if c.is_midi else "audio"
         name = f'"{c.name}"' if c.name else "(unnamed)"
-        status = " [playing]" if c.is_playing else (" [recording]" if c.is_recording else "")
-        lines.append(f"  slot {c.slot_index}: {name} | {kind} | {c.length:.1f} beats{status}")
+        status = (
+            " [playing]" if c.is_playing else (" [recording]" if c.is_recording else "")
+        )
+        lines.append(
+            f"  slot {c.slot_index}: {name} | {kind} | {c.length:.1f} beats{status}"
+        )
     return "\n".join(lines)
 
 
-def format_arrangement_clips(data: TrackArrangementClips) -> str:
-    """Format arrangement clips as compact summary for LLM."""
+def format_arrangement_clips(
+    data: TrackArrangementClips, start: int = 0, stop: int | None = None
+) -> str:
+    """Format arrangement clips as compact summary for LLM.
+
+    Only clips[start:stop] are listed, each with its index in the full list;
+    the header always gives the track's total clip count.
+    """
     if not data.clips:
         return f"Track [{data.track_index}] '{data.track_name}': no arrangement clips"
-    lines = [f"Track [{data.track_index}] '{data.track_name}': {len(data.clips)} clip(s)"]
-    for c in data.clips:
+    lines = [
+        f"Track [{data.track_index}] '{data.track_name}': {len(data.clips)} clip(s)"
+    ]
+    for i, c in enumerate(data.clips[start:stop], start):
         kind = "MIDI" if c.is_midi else "audio"
         name = f'"{c.name}"' if c.name else "(unnamed)"
-        lines.append(f"  {name} | {kind} | {c.start_time:.1f}–{c.end_time:.1f} beats")
+        lines.append(
+            f"  [{i}] {name} | {kind} | {c.start_time:.1f}–{c.end_time:.1f} beats"
+        )
     return "\n".join(lines)
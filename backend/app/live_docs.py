@@ -8,6 +8,7 @@ and is rebuilt automatically whenever the XML file is newer than the last build.
 import re
 import sqlite3
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
 
 from .logger import logger
@@ -15,6 +16,8 @@ from .logger import logger
 LIVE_DOCS_XML = Path.home() / ".abby" / "live-docs.xml"
 LIVE_DOCS_DB = Path.home() / ".abby" / "live-docs.db"
 
+_TOKEN_RE = re.compile(r"\w+")
+
 _conn: sqlite3.Connection | None = None
 
 
@@ -60,9 +63,7 @@ def _open_conn() -> sqlite3.Connection:
 
     xml_mtime = LIVE_DOCS_XML.stat().st_mtime
     try:
-        row = conn.execute(
-            "SELECT value FROM _meta WHERE key='xml_mtime'"
-        ).fetchone()
+        row = conn.execute("SELECT value FROM _meta WHERE key='xml_mtime'").fetchone()
         if row and float(row[0]) >= xml_mtime:
             logger.info("[live_docs] FTS5 index is up to date")
             return conn
@@ -86,10 +87,24 @@ def _fts_query(query: str) -> str:
     Splits on any non-word character (including dots, which FTS5 rejects as
     syntax errors). Each token becomes an independent AND term.
     """
-    tokens = re.findall(r"\w+", query)
+    tokens = _TOKEN_RE.findall(query)
     return " ".join(tokens)
 
 
+@lru_cache(maxsize=1024)
+def _search_rows(fts: str, limit: int) -> tuple[tuple[str, str, str], ...]:
+    """Run an FTS5 query.
+
+    Cached on the normalised query: the index is built once per process, so
+    the same query always returns the same rows.
+    """
+    cursor = _get_conn().execute(
+        "SELECT tag, name, doc FROM api_docs WHERE api_docs MATCH ? ORDER BY rank LIMIT ?",
+        (fts, limit),
+    )
+    return tuple(cursor.fetchall())
+
+
 def search(query: str, limit: int = 8) -> str:
     """Search the Live API docs and return a formatted result string."""
     if not LIVE_DOCS_XML.exists():
@@ -104,10 +119,7 @@ def search(query: str, limit: int = 8) -> str:
         return "Empty query."
 
     try:
-        rows = _get_conn().execute(
-            "SELECT tag, name, doc FROM api_docs WHERE api_docs MATCH ? ORDER BY rank LIMIT ?",
-            (fts, limit),
-        ).fetchall()
+        rows = _search_rows(fts, limit)
     except sqlite3.OperationalError as e:
         logger.error("[live_docs] Search error: %s", e)
         return f"Search error: {e}"
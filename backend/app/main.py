@@ -39,7 +39,7 @@ app.include_router(api_router, prefix="/api")
 
 def _make_sender(ws: WebSocket) -> EventSender:
     async def send(event: AppEvent) -> None:
-        await ws.send_json(event.model_dump(exclude_none=True))
+        await ws.send_text(event.model_dump_json(exclude_none=True))
 
     return send
 
@@ -80,8 +80,6 @@ async def websocket_endpoint(
             f"[WS /ws] WebSocket connected - session: {sessionId}, project: {project.name}"
         )
 
-        await ableton_client.start()
-
         existing_session = chat_repo.get_chat_session(sessionId)
         is_new_session = existing_session is None
         if is_new_session:
@@ -108,8 +106,8 @@ async def websocket_endpoint(
                     projectId,
                     data.get("approvals", {}),
                 ):
-                    logger.info(f"[WS /ws] Sending chunk: {chunk}")
-                    await websocket.send_json(chunk.model_dump())
+                    logger.info("[WS /ws] Sending chunk: %s", chunk)
+                    await websocket.send_text(chunk.model_dump_json())
                     await asyncio.sleep(0)
                 continue
 
@@ -135,8 +133,8 @@ async def websocket_endpoint(
                 projectId,
                 {"role": "user", "content": msg},
             ):
-                logger.info(f"[WS /ws] Sending chunk: {chunk}")
-                await websocket.send_json(chunk.model_dump())
+                logger.info("[WS /ws] Sending chunk: %s", chunk)
+                await websocket.send_text(chunk.model_dump_json())
                 await asyncio.sleep(0)
 
     except WebSocketDisconnect:
@@ -166,6 +164,10 @@ async def websocket_endpoint(
             },
         )
         await websocket.close(code=1011, reason=str(e))
+    finally:
+        # History is persisted in the background; finish before the DB session
+        # for this connection is closed.
+        await chat_service.flush_saves()
 
 
 async def process_agent_with_tts(
@@ -188,6 +190,7 @@ async def process_agent_with_tts(
             yield item
 
     async def agent_consumer():
+        text_chunks = 0
         async for chunk in chat_service.process_message(
             session_id, project_id, message
         ):
@@ -195,14 +198,20 @@ async def process_agent_with_tts(
                 sentences = buffer.add(chunk.content)
                 for sentence in sentences:
                     await text_queue.put(sentence)
+                # Text chunks never touch the socket here, and the unbounded
+                # queue never blocks, so yield now and then to let the TTS
+                # producer and other connections run.
+                text_chunks += 1
+                if text_chunks % 16 == 0:
+                    await asyncio.sleep(0)
             elif chunk.type == "end_message":
                 remaining = buffer.flush()
                 if remaining:
                     await text_queue.put(remaining)
                 await text_queue.put(None)
-                await websocket.send_json(chunk.model_dump())
+                await websocket.send_text(chunk.model_dump_json())
             else:
-                await websocket.send_json(chunk.model_dump())
+                await websocket.send_text(chunk.model_dump_json())
 
     async def tts_producer():
         try:
@@ -260,8 +269,6 @@ async def websocket_audio_endpoint(
             f"[WS /ws/audio] WebSocket connected - session: {sessionId}, project: {project.name}"
         )
 
-        await ableton_client.start()
-
         existing_session = chat_repo.get_chat_session(sessionId)
         is_new_session = existing_session is None
         if is_new_session:
@@ -339,6 +346,10 @@ async def websocket_audio_endpoint(
             },
         )
         await websocket.close(code=1011, reason=str(e))
+    finally:
+        # History is persisted in the background; finish before the DB session
+        # for this connection is closed.
+        await chat_service.flush_saves()
 
 
 @app.get("/")
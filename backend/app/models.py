@@ -44,6 +44,8 @@ class DeviceParameters(BaseModel):
 
 
 class SongContext(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tempo: float
     time_sig_numerator: int
     time_sig_denominator: int
@@ -92,7 +94,7 @@ class Note(BaseModel):
     pitch: int  # MIDI pitch 0-127
     start_time: float  # in beats
     duration: float  # in beats
-    velocity: int  # 0-127
+    velocity: int = 100  # 0-127
     mute: bool = False
 
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from app.skills import SkillRegistry, get_skill_registry
@@ -71,7 +72,9 @@ def get_session_messages(
         logger.info(
             f"[GET /api/session/{session_id}/messages] Successfully fetched messages for session: {session_id}"
         )
-        return {"messages": messages}
+        # The display dicts are already plain JSON types, so skip the
+        # jsonable_encoder pass FastAPI would otherwise run over every message.
+        return JSONResponse({"messages": messages})
     except HTTPException as e:
         raise e
     except Exception as e:
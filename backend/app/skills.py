@@ -68,6 +68,7 @@ class Skill(BaseModel):
 # ---------------------------------------------------------------------------
 
 _FRONTMATTER_RE = re.compile(r"^\s*---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_BARE_VALUE_RE = re.compile(r"^(\s*\w+:\s*)(.+)$", re.MULTILINE)
 
 
 def _parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
@@ -81,7 +82,7 @@ def _parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
         data = yaml.safe_load(raw_yaml)
     except yaml.YAMLError:
         # Fallback: wrap bare colon values in quotes and retry once.
-        fixed = re.sub(r"^(\s*\w+:\s*)(.+)$", r'\1"\2"', raw_yaml, flags=re.MULTILINE)
+        fixed = _BARE_VALUE_RE.sub(r'\1"\2"', raw_yaml)
         try:
             data = yaml.safe_load(fixed)
         except yaml.YAMLError:
@@ -649,3 +649,89 @@ class TestSetDeviceParameter:
             )
         )
         assert response["status"] == "error"
+
+
+@pytest.mark.write
+class TestFillArrangementSection:
+    @pytest.fixture(autouse=True)
+    def scratch_track(self):
+        """Run each test against a fresh MIDI track with a 4-beat clip in slot 0."""
+        created = assert_success(send_command(cmd("create_midi_track", {"index": -1})))
+        self.track_index = created["index"]
+        assert_success(
+            send_command(
+                cmd(
+                    "create_clip",
+                    {"track_index": self.track_index, "clip_index": 0, "length": 4.0},
+                )
+            )
+        )
+        yield
+        send_command(cmd("delete_track", {"index": self.track_index}))
+
+    def test_fills_range_with_copies_of_source_clip(self):
+        result = assert_success(
+            send_command(
+                cmd(
+                    "fill_arrangement_section",
+                    {
+                        "track_index": self.track_index,
+                        "source_slot": 0,
+                        "start_beat": 8.0,
+                        "end_beat": 20.0,
+                    },
+                )
+            )
+        )
+        assert result["clip_count"] == 3
+        assert result["clip_length"] == 4.0
+
+        clips = assert_success(
+            send_command(
+                cmd("get_arrangement_clips", {"track_index": self.track_index})
+            )
+        )["clips"]
+        assert [c["start_time"] for c in clips] == [8.0, 12.0, 16.0]
+        assert all(c["length"] == 4.0 for c in clips)
+
+    def test_empty_source_slot_returns_error(self):
+        response = send_command(
+            cmd(
+                "fill_arrangement_section",
+                {
+                    "track_index": self.track_index,
+                    "source_slot": 1,
+                    "start_beat": 0.0,
+                    "end_beat": 4.0,
+                },
+            )
+        )
+        assert response["status"] == "error"
+
+    def test_invalid_track_returns_error(self):
+        response = send_command(
+            cmd(
+                "fill_arrangement_section",
+                {
+                    "track_index": 9999,
+                    "source_slot": 0,
+                    "start_beat": 0.0,
+                    "end_beat": 4.0,
+                },
+            )
+        )
+        assert response["status"] == "error"
+
+    def test_invalid_source_slot_returns_error(self):
+        response = send_command(
+            cmd(
+                "fill_arrangement_section",
+                {
+                    "track_index": self.track_index,
+                    "source_slot": 99999,
+                    "start_beat": 0.0,
+                    "end_beat": 4.0,
+                },
+            )
+        )
+        assert response["status"] == "error"